@@ -1,22 +1,36 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logger(name: str = "multi_data_manager", level: int = logging.INFO) -> logging.Logger:
     """
     Sets up a logger with a standard configuration.
+
+    Records are handed off to a background QueueListener that owns the actual
+    stream handler, so logging from hot paths is a non-blocking queue put
+    instead of a locked write to stdout.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setLevel(level)
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
 
     return logger
 
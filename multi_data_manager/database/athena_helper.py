@@ -1,9 +1,14 @@
+import weakref
 from typing import Any, Optional, List, Tuple, Union
 
 import boto3
-from pyathena import connect
 
-from multi_data_manager.core.exceptions import DatabaseError
+try:
+    from pyathena import connect
+except ImportError:  # pragma: no cover - optional, install the athena extra
+    connect = None
+
+from multi_data_manager.core.exceptions import ConfigurationError, DatabaseError
 from multi_data_manager.core.logger import logger
 
 
@@ -14,6 +19,18 @@ class AthenaHelper:
     DB_ATHENA = 'athena'
     DB_AWS_CLI = 'aws_cli'
 
+    # One boto3 session per profile, shared across live helpers so the
+    # credential-provider chain is only walked once per profile.
+    _sessions = weakref.WeakValueDictionary()
+
+    @classmethod
+    def _get_session(cls, profile: str) -> boto3.Session:
+        session = cls._sessions.get(profile)
+        if session is None:
+            session = boto3.Session(profile_name=profile)
+            cls._sessions[profile] = session
+        return session
+
     def __init__(self, db_type: str, connection_info: Any):
         """
         Initialize the AthenaHelper with database type and connection information.
@@ -27,7 +44,10 @@ class AthenaHelper:
         self.connection = None
         self._establish_connection()
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
         self.close_connection()
 
     def get_connection(self):
@@ -43,20 +63,29 @@ class AthenaHelper:
 
     def _establish_connection(self):
         try:
-            boto3.setup_default_session(profile_name=self.connection_info.profile)
+            # An explicit per-profile session instead of mutating boto3's
+            # global default session, which is not thread safe across helpers
+            # using different profiles.
+            self._aws_session = self._get_session(self.connection_info.profile)
 
             if self.db_type == self.DB_ATHENA:
+                if connect is None:
+                    raise ConfigurationError(
+                        "pyathena is not installed; install multi_data_manager[athena] for Athena support")
                 self.connection = connect(
                     s3_staging_dir=self.connection_info.s3_staging_dir,
                     region_name=self.connection_info.region,
-                    schema_name=self.connection_info.database
+                    schema_name=self.connection_info.database,
+                    profile_name=self.connection_info.profile
                 )
             elif self.db_type == self.DB_AWS_CLI:
-                self.connection = boto3.client(self.connection_info.service)
+                self.connection = self._aws_session.client(self.connection_info.service)
             else:
                 raise DatabaseError(f"Unsupported database type: {self.db_type}")
+        except ConfigurationError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to connect to {self.db_type}: {e}")
+            logger.error("Failed to connect to %s: %s", self.db_type, e)
             raise DatabaseError(f"Connection failed: {e}")
 
     def close_connection(self):
@@ -67,17 +96,57 @@ class AthenaHelper:
             try:
                 if self.db_type == self.DB_ATHENA:
                     self.connection.close()
-                logger.info(f'{self.db_type} connection closed.')
+                logger.info('%s connection closed.', self.db_type)
             except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+                logger.error("Error closing connection: %s", e)
+
+    def iter_query(self, query: str, params: Optional[Union[List, Tuple]] = None, batch: int = 10000):
+        """
+        Execute a query on Athena and yield rows in batches.
+
+        Rows are paged with fetchmany so memory stays bounded by the batch
+        size and callers can start processing before the full result set
+        has been fetched.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (Optional[Union[List, Tuple]]): Optional parameters for the query.
+            batch (int): Number of rows fetched per round trip.
 
-    def execute_query(self, query: str, params: Optional[Union[List, Tuple]] = None) -> Optional[List[Any]]:
+        Yields:
+            Any: Result rows, one at a time.
+        """
+        if self.db_type != self.DB_ATHENA:
+            raise DatabaseError("iter_query is only supported for Athena in this helper.")
+
+        cursor = self.get_connection().cursor()
+        try:
+            cursor.arraysize = batch
+            cursor.execute(query, params)
+            if cursor.description:
+                while True:
+                    rows = cursor.fetchmany(batch)
+                    if not rows:
+                        break
+                    yield from rows
+        except Exception as e:
+            logger.error("Error executing Athena query: %s - %s", query, e)
+            raise DatabaseError(f"Athena query failed: {e}")
+        finally:
+            cursor.close()
+
+    def execute_query(self, query: str, params: Optional[Union[List, Tuple]] = None,
+                      batch: int = 10000) -> Optional[List[Any]]:
         """
         Execute a query on Athena.
 
+        Prefer iter_query in hot paths; this method materializes the full
+        result list for backwards compatibility.
+
         Args:
             query (str): The SQL query to execute.
             params (Optional[Union[List, Tuple]]): Optional parameters for the query.
+            batch (int): Number of rows fetched per round trip.
 
         Returns:
             Optional[List[Any]]: The result rows from the query, if any.
@@ -88,12 +157,18 @@ class AthenaHelper:
         rows = None
         try:
             cursor = self.get_connection().cursor()
+            cursor.arraysize = batch
             cursor.execute(query, params)
             if cursor.description:
-                rows = cursor.fetchall()
+                rows = []
+                while True:
+                    fetched = cursor.fetchmany(batch)
+                    if not fetched:
+                        break
+                    rows.extend(fetched)
             cursor.close()
         except Exception as e:
-            logger.error(f"Error executing Athena query: {query} - {e}")
+            logger.error("Error executing Athena query: %s - %s", query, e)
             raise DatabaseError(f"Athena query failed: {e}")
 
         return rows
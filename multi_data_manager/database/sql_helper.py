@@ -1,35 +1,71 @@
 import functools
+import os
+import random
+import tempfile
 import time
 from contextlib import contextmanager
 from typing import Optional, Any, List, Union, Tuple, Dict
 
 import mysql.connector
 import pandas as pd
-import pyodbc
+import pymysql
 from mysql.connector import errorcode
 from sqlalchemy import create_engine
 
-from multi_data_manager.core.exceptions import DatabaseError
+try:
+    import pyodbc
+except ImportError:  # pragma: no cover - optional, install the mssql extra
+    pyodbc = None
+
+from multi_data_manager.core.exceptions import ConfigurationError, DatabaseError
 from multi_data_manager.core.logger import logger
 
 
-def retry_on_lock_error(retries=3, delay=2):
+# Retriable MySQL error codes mapped to a backoff multiplier: lock waits and
+# deadlocks clear quickly, a saturated server (too many connections) deserves
+# a longer pause before hammering it again.
+_RETRIABLE_ERRNOS = {
+    errorcode.ER_LOCK_WAIT_TIMEOUT: 1,
+    errorcode.ER_LOCK_DEADLOCK: 1,
+    errorcode.CR_SERVER_GONE_ERROR: 1,
+    errorcode.CR_SERVER_LOST: 1,
+    errorcode.ER_CON_COUNT_ERROR: 4,
+}
+
+# Errors where the connection itself is dead and must be re-established
+# before the retry can succeed.
+_RECONNECT_ERRNOS = {errorcode.CR_SERVER_GONE_ERROR, errorcode.CR_SERVER_LOST}
+
+
+def retry_on_lock_error(retries=3, delay=1, cap=30):
+    """
+    Retries the wrapped method on transient MySQL errors (lock wait timeout,
+    deadlock, lost/gone-away connection, too many connections) with exponential
+    backoff and jitter so concurrent callers do not retry in lockstep. Lost
+    connections are re-established before retrying. Non-retriable errors and
+    exhausted retries raise DatabaseError chained to the original exception.
+    """
+
     def decorator(func):
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(self, *args, **kwargs):
             for attempt in range(retries):
                 try:
-                    return func(*args, **kwargs)
+                    return func(self, *args, **kwargs)
                 except mysql.connector.Error as error:
-                    if error.errno in {errorcode.ER_LOCK_WAIT_TIMEOUT, errorcode.ER_LOCK_DEADLOCK}:
-                        if attempt < retries - 1:
-                            time.sleep(delay)
-                        else:
-                            raise DatabaseError(f"Lock error after retries: {error}")
-                    else:
-                        raise DatabaseError(f"MySQL error: {error}")
-                except Exception as e:
-                    raise DatabaseError(f"Database error: {e}")
+                    base = _RETRIABLE_ERRNOS.get(error.errno)
+                    if base is None or attempt == retries - 1:
+                        raise DatabaseError(f"MySQL error: {error}") from error
+
+                    sleep_for = min(cap, delay * base * 2 ** attempt) * random.uniform(0.5, 1.5)
+                    logger.warning(
+                        "Retriable MySQL error %s (attempt %s/%s), retrying in %.1fs: %s",
+                        error.errno, attempt + 1, retries, sleep_for, error)
+                    time.sleep(sleep_for)
+
+                    if error.errno in _RECONNECT_ERRNOS:
+                        self.connection = None
+                        self._establish_connection()
             return None
 
         return wrapper
@@ -37,6 +73,18 @@ def retry_on_lock_error(retries=3, delay=2):
     return decorator
 
 
+@functools.lru_cache(maxsize=64)
+def _build_ddl(columns: Tuple[Tuple[str, str], ...], indexes: Optional[Tuple[str, ...]]) -> Tuple[str, str]:
+    """
+    Builds the column and index SQL fragments for a CREATE TABLE statement.
+    Arguments are hashable tuples so workflows that recreate many tables with
+    the same schema reuse the joined strings instead of rebuilding them.
+    """
+    needed_columns = ', '.join([f'{col} {col_type}' for col, col_type in columns])
+    needed_indexes = ', '.join([f'INDEX ({index})' for index in indexes]) if indexes else ''
+    return needed_columns, needed_indexes
+
+
 class SQLHelper:
     """
     Helper class for SQL databases (MySQL, SQL Server).
@@ -55,9 +103,14 @@ class SQLHelper:
         self.db_type = db_type
         self.connection_info = connection_info
         self.connection = None
+        self._read_engine = None
+        self._write_engine = None
         self._establish_connection()
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
         self.close_connection()
 
     def get_connection(self):
@@ -77,6 +130,10 @@ class SQLHelper:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        if self.db_type == self.DB_SQL_SERVER:
+            # Send parameter arrays in a single TDS RPC instead of looping
+            # single-row executes inside pyodbc.
+            cursor.fast_executemany = True
         try:
             yield cursor
         finally:
@@ -91,9 +148,13 @@ class SQLHelper:
                     password=self.connection_info.password,
                     database=self.connection_info.database,
                     autocommit=False,
-                    allow_local_infile=True
+                    allow_local_infile=True,
+                    use_pure=False
                 )
             elif self.db_type == self.DB_SQL_SERVER:
+                if pyodbc is None:
+                    raise ConfigurationError(
+                        "pyodbc is not installed; install multi_data_manager[mssql] for SQL Server support")
                 connection_string = (
                     f'DRIVER={{FreeTDS}};'
                     f'SERVER={self.connection_info.host};'
@@ -106,23 +167,70 @@ class SQLHelper:
                 self.connection = pyodbc.connect(connection_string)
             else:
                 raise DatabaseError(f"Unsupported database type: {self.db_type}")
+        except ConfigurationError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to connect to {self.db_type}: {e}")
+            logger.error("Failed to connect to %s: %s", self.db_type, e)
             raise DatabaseError(f"Connection failed: {e}")
 
+    def _connection_url(self) -> str:
+        return (f'mysql+pymysql://{self.connection_info.username}:'
+                f'{self.connection_info.password}@{self.connection_info.host}:'
+                f'3306/{self.connection_info.database}')
+
+    def _get_read_engine(self):
+        """
+        Returns the cached engine used for DataFrame reads: AUTOCOMMIT so
+        SELECTs never hold an open transaction, with a server-side cursor so
+        results stream instead of being buffered client-side.
+        """
+        if self._read_engine is None:
+            self._read_engine = create_engine(
+                self._connection_url(),
+                isolation_level='AUTOCOMMIT',
+                pool_size=4,
+                pool_recycle=1800,
+                connect_args={'cursorclass': pymysql.cursors.SSCursor},
+                future=True
+            )
+        return self._read_engine
+
+    def _get_write_engine(self):
+        """
+        Returns the cached engine used for DataFrame writes, pooled separately
+        from reads so bulk loads do not starve queries (and vice versa).
+        """
+        if self._write_engine is None:
+            self._write_engine = create_engine(
+                self._connection_url(),
+                pool_size=8,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+                future=True
+            )
+        return self._write_engine
+
     def close_connection(self):
         """
         Closes the database connection if it is open.
         """
+        for attr in ('_read_engine', '_write_engine'):
+            engine = getattr(self, attr)
+            if engine is not None:
+                try:
+                    engine.dispose()
+                    setattr(self, attr, None)
+                except Exception as e:
+                    logger.error("Error disposing SQLAlchemy engine: %s", e)
         if self.connection:
             try:
                 if self.db_type == self.DB_MYSQL and self.connection.is_connected():
                     self.connection.close()
                 elif self.db_type == self.DB_SQL_SERVER and not self.connection.closed:
                     self.connection.close()
-                logger.info(f'{self.db_type} connection closed.')
+                logger.info('%s connection closed.', self.db_type)
             except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+                logger.error("Error closing connection: %s", e)
 
     @retry_on_lock_error()
     def execute_query(self, query: str, params: Optional[Union[List, Tuple]] = None, execute_many: bool = False,
@@ -142,9 +250,6 @@ class SQLHelper:
         rows = None
         try:
             with self.get_cursor() as cursor:
-                if self.db_type == self.DB_MYSQL:
-                    cursor.execute(f'USE {self.connection_info.database};')
-
                 if params:
                     if execute_many:
                         for i in range(0, len(params), batch_size):
@@ -157,9 +262,15 @@ class SQLHelper:
 
                 if cursor.description:
                     rows = cursor.fetchall()
+        except mysql.connector.Error as e:
+            # Re-raise unchanged so retry_on_lock_error can see the errno and
+            # back off; the decorator wraps non-retriable errors itself.
+            self.get_connection().rollback()
+            logger.error("Error executing query: %s - %s", query, e)
+            raise
         except Exception as e:
             self.get_connection().rollback()
-            logger.error(f"Error executing query: {query} - {e}")
+            logger.error("Error executing query: %s - %s", query, e)
             raise DatabaseError(f"Query execution failed: {e}")
 
         return rows
@@ -178,18 +289,24 @@ class SQLHelper:
             with self.get_cursor() as cursor:
                 cursor.execute(f'DROP TABLE IF EXISTS `{table_name}`;')
 
-                needed_columns = ', '.join([f'{col} {col_type}' for col, col_type in columns.items()])
-                needed_indexes = ', '.join([f'INDEX ({index})' for index in indexes]) if indexes else ''
+                needed_columns, needed_indexes = _build_ddl(
+                    tuple(columns.items()), tuple(indexes) if indexes else None)
 
                 query = f'CREATE TABLE `{table_name}` ({needed_columns}' + (
                     f', {needed_indexes}' if needed_indexes else '') + ');'
                 cursor.execute(query)
-                logger.info(f"Table {table_name} created successfully.")
+                logger.info("Table %s created successfully.", table_name)
+        except mysql.connector.Error as e:
+            # Re-raise unchanged so retry_on_lock_error can see the errno and
+            # back off; the decorator wraps non-retriable errors itself.
+            logger.error("Error creating table %s: %s", table_name, e)
+            raise
         except Exception as e:
-            logger.error(f"Error creating table {table_name}: {e}")
+            logger.error("Error creating table %s: %s", table_name, e)
             raise DatabaseError(f"Create table failed: {e}")
 
-    def query_to_dataframe(self, query: str, params=None, dtype=None) -> pd.DataFrame:
+    def query_to_dataframe(self, query: str, params=None, dtype=None,
+                           chunksize: Optional[int] = None) -> pd.DataFrame:
         """
         Executes a SQL query and returns the result as a pandas DataFrame.
 
@@ -197,29 +314,82 @@ class SQLHelper:
             query (str): The SQL query to execute.
             params: Optional parameters for the SQL query.
             dtype: Optional data types for the DataFrame columns.
+            chunksize (Optional[int]): If set, rows are fetched in chunks of this
+                size (streamed server-side for MySQL) and concatenated, bounding
+                peak memory to one chunk instead of the full result set.
 
         Returns:
             pd.DataFrame: Resulting DataFrame from the query.
         """
         try:
-            # Construct connection string for SQLAlchemy
             if self.db_type == self.DB_MYSQL:
-                conn_str = (f'mysql+pymysql://{self.connection_info.username}:'
-                            f'{self.connection_info.password}@{self.connection_info.host}:'
-                            f'3306/{self.connection_info.database}')
-                engine = create_engine(conn_str)
+                engine = self._get_read_engine()
+                if chunksize:
+                    # Stream results server-side so rows are not buffered client-side.
+                    with engine.connect().execution_options(stream_results=True) as conn:
+                        chunks = pd.read_sql(query, conn, params=params, coerce_float=False,
+                                             dtype=dtype, chunksize=chunksize)
+                        return pd.concat(chunks, copy=False, ignore_index=True)
                 return pd.read_sql(query, engine, params=params, coerce_float=False, dtype=dtype)
             else:
                 # Fallback for other types or implement specific logic
+                if chunksize:
+                    chunks = pd.read_sql(query, self.get_connection(), params=params,
+                                         coerce_float=False, dtype=dtype, chunksize=chunksize)
+                    return pd.concat(chunks, copy=False, ignore_index=True)
                 return pd.read_sql(query, self.get_connection(), params=params, coerce_float=False, dtype=dtype)
         except Exception as e:
-            logger.error(f"Error converting query to dataframe: {e}")
+            logger.error("Error converting query to dataframe: %s", e)
             raise DatabaseError(f"DataFrame conversion failed: {e}")
 
+    def _load_dataframe_infile(self, df: pd.DataFrame, table_name: str, if_exists: str, index: bool):
+        """
+        Bulk-loads a DataFrame into MySQL via LOAD DATA LOCAL INFILE, bypassing
+        per-row INSERT statements entirely. The connection is already opened with
+        allow_local_infile=True.
+        """
+        engine = self._get_write_engine()
+        # Create/replace the table schema without inserting any rows.
+        df.head(0).to_sql(table_name, con=engine, if_exists=if_exists, index=index)
+
+        # mysql.connector reads the infile from a path, so spool the CSV to a
+        # temporary file rather than an in-memory buffer.
+        tmp = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', newline='',
+                                          encoding='utf-8', delete=False)
+        try:
+            # Write the canonical LOAD DATA format (ESCAPED BY '\', \N for
+            # NULL). to_csv does not backslash-escape, so double any literal
+            # backslash in string cells up front; everything else (quotes,
+            # separators, newlines) is covered by the CSV quoting. This keeps
+            # \N as the only NULL marker, so a cell holding the literal
+            # string 'NULL' survives as a string.
+            str_cols = df.select_dtypes(include=['object', 'string']).columns
+            if len(str_cols):
+                df = df.copy()
+                for col in str_cols:
+                    df[col] = df[col].map(
+                        lambda v: v.replace('\\', '\\\\') if isinstance(v, str) else v)
+            df.to_csv(tmp, index=index, header=False, na_rep='\\N')
+            tmp.close()
+            with self.get_cursor() as cursor:
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE '{tmp.name}' INTO TABLE `{table_name}` "
+                    "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                    "LINES TERMINATED BY '\\n'"
+                )
+            self.get_connection().commit()
+        finally:
+            tmp.close()
+            os.unlink(tmp.name)
+
     def dataframe_to_table(self, df: pd.DataFrame, table_name: str, if_exists: str = 'replace', index: bool = False):
         """
         Saves a pandas DataFrame to a SQL table.
 
+        For MySQL the data is bulk-loaded with LOAD DATA LOCAL INFILE, which is
+        substantially faster than multi-row INSERTs; if that fails for any reason
+        the method falls back to pandas to_sql with method='multi'.
+
         Args:
             df (pd.DataFrame): DataFrame to save.
             table_name (str): Name of the target table.
@@ -227,15 +397,15 @@ class SQLHelper:
             index (bool): Whether to write DataFrame index as a column.
         """
         try:
-            # Using SQLAlchemy engine for pandas to_sql
             if self.db_type == self.DB_MYSQL:
-                conn_str = (f'mysql+pymysql://{self.connection_info.username}:'
-                            f'{self.connection_info.password}@{self.connection_info.host}:'
-                            f'3306/{self.connection_info.database}')
-                engine = create_engine(conn_str)
-                df.to_sql(table_name, con=engine, if_exists=if_exists, index=index, method='multi')
+                try:
+                    self._load_dataframe_infile(df, table_name, if_exists, index)
+                except Exception as e:
+                    logger.warning("LOAD DATA LOCAL INFILE failed, falling back to to_sql: %s", e)
+                    engine = self._get_write_engine()
+                    df.to_sql(table_name, con=engine, if_exists=if_exists, index=index, method='multi')
             else:
                 raise NotImplementedError("dataframe_to_table only implemented for MySQL via SQLAlchemy in this helper")
         except Exception as e:
-            logger.error(f"Error saving dataframe to table: {e}")
+            logger.error("Error saving dataframe to table: %s", e)
             raise DatabaseError(f"DataFrame save failed: {e}")
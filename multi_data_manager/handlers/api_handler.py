@@ -1,10 +1,36 @@
+import threading
 from typing import Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from multi_data_manager.core.exceptions import APIError
 from multi_data_manager.core.logger import logger
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns a shared keep-alive session so repeated API calls reuse TCP/TLS
+    connections instead of paying a fresh handshake per request.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.trust_env = False
+                adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                                      max_retries=Retry(total=3, backoff_factor=0.3,
+                                                        status_forcelist=[502, 503, 504]))
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
 
 class APIHandler:
     """
@@ -30,16 +56,13 @@ class APIHandler:
                 "Content-Type": "application/json"
             }
 
-            with requests.Session() as session:
-                session.trust_env = False
-                response = session.get(api_url, headers=headers, verify=True)
-
+            response = _get_session().get(api_url, headers=headers, verify=True)
             response.raise_for_status()
             return response.json()
 
         except requests.exceptions.RequestException as e:
-            logger.error(f'Error occurred while invoking API: {e}')
+            logger.error('Error occurred while invoking API: %s', e)
             raise APIError(f"API request failed: {e}")
         except Exception as e:
-            logger.error(f'Unknown error occurred in invoke_api() function: {e}')
+            logger.error('Unknown error occurred in invoke_api() function: %s', e)
             raise APIError(f"Unknown API error: {e}")
@@ -1,70 +1,104 @@
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Tuple, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is preferred but optional
+    orjson = None
+
 from multi_data_manager.core.constants import MAX_WORKERS
 from multi_data_manager.core.logger import logger
 from multi_data_manager.utils.custom_encoder import CustomEncoder
 
 
+# Maps concrete types to the callable that turns them into JSON-ready data,
+# so the isinstance/hasattr probing runs once per type instead of per object.
+_SERIALIZERS = {}
+
+
+def _to_data(obj: Any) -> Any:
+    fn = _SERIALIZERS.get(type(obj))
+    if fn is None:
+        if isinstance(obj, dict):
+            fn = lambda x: x
+        elif hasattr(obj, 'model_dump'):
+            fn = lambda x: x.model_dump(exclude_none=True, exclude_unset=True)
+        else:
+            # Fallback or assume it's serializable
+            fn = lambda x: x
+        _SERIALIZERS[type(obj)] = fn
+    return fn(obj)
+
+
+def _write_json(json_object: Any, file_name: str, indent: int = 2):
+    """
+    Serializes a JSON object and writes it to file_name. Kept at module level
+    so it can be submitted to a process pool.
+    """
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(json_object, default=CustomEncoder().default, option=option)
+    else:
+        data = json.dumps(json_object, cls=CustomEncoder, ensure_ascii=False,
+                          indent=indent).encode('utf-8')
+
+    with open(file_name, 'wb') as outfile:
+        outfile.write(data)
+
+
 class FileHandler:
     """
     A class to handle local file operations, including exporting data to JSON files.
     """
 
     @staticmethod
-    def export_to_json(json_object: Any, file_name: str, indent: int = 2) -> str:
+    def export_to_json(json_object: Any, file_name: str, indent: int = 2):
         """
         Exports a JSON object to a file with the specified indentation.
 
+        Serialization uses orjson when available, writing the resulting bytes
+        straight to a binary file without building an intermediate string
+        (orjson only supports 2-space indentation, so any truthy indent means
+        2 spaces on that path).
+
         Args:
             json_object (Any): The JSON-serializable object to export.
             file_name (str): The target file path where the JSON will be saved.
             indent (int): The number of spaces for indentation in the JSON file.
-
-        Returns:
-            str: The JSON string that was written to the file.
         """
-        os.makedirs(os.path.dirname(file_name), exist_ok=True)
-
-        json_result = json.dumps(json_object, cls=CustomEncoder, ensure_ascii=False, indent=indent)
-        with open(file_name, 'w', encoding='utf-8') as outfile:
-            outfile.write(json_result)
-
-        return json_result
+        _write_json(json_object, file_name, indent)
 
     def export_all(self, targeted_files: List[Tuple[str, Any]], source_folder: str, object_data_type: str):
         """
         Exports multiple JSON objects to file concurrently.
 
+        Serialization is CPU-bound, so the work is spread over a process pool
+        rather than threads, which the GIL would serialize.
+
         Args:
             targeted_files (List[Tuple[str, Any]]): A list of tuples containing file names
                 and their corresponding JSON-serializable objects.
             source_folder (str): The base folder where files will be saved.
             object_data_type (str): A subfolder name to categorize the files.
         """
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
             futures = []
             for object_name, target_object in targeted_files:
                 if target_object:
-                    if isinstance(target_object, dict):
-                        json_data = target_object
-                    elif hasattr(target_object, 'model_dump'):
-                        json_data = target_object.model_dump(exclude_none=True, exclude_unset=True)
-                    else:
-                        # Fallback or assume it's serializable
-                        json_data = target_object
-
+                    json_data = _to_data(target_object)
                     file_path = os.path.join(source_folder, object_data_type, object_name)
-                    future = executor.submit(self.export_to_json, json_data, file_path, 2)
+                    future = executor.submit(_write_json, json_data, file_path, 2)
                     futures.append(future)
                 else:
-                    logger.warning(f'No data found for {object_name}')
+                    logger.warning('No data found for %s', object_name)
 
             for future in as_completed(futures):
                 try:
                     future.result()
                 except Exception as e:
-                    logger.error(f'Error in FileHandler.export_all: {e}')
+                    logger.error('Error in FileHandler.export_all: %s', e)
                     raise
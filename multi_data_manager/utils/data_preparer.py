@@ -1,5 +1,10 @@
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is preferred but optional
+    orjson = None
+
 from multi_data_manager.utils.custom_encoder import CustomEncoder
 
 
@@ -9,15 +14,26 @@ class DataPreparer:
     """
 
     @staticmethod
-    def prepare_json(data, indent=None):
+    def prepare_json(data, indent=None) -> bytes:
         """
-        Converts data to a JSON string using CustomEncoder.
+        Converts data to UTF-8 encoded JSON bytes.
+
+        Returning bytes avoids a decode/encode round trip: every consumer
+        (S3 bodies, file writes) ultimately needs bytes, and orjson produces
+        them natively. Serialization uses orjson when available, with
+        CustomEncoder.default handling the types orjson cannot encode
+        natively; stdlib json with CustomEncoder is the fallback. orjson only
+        supports 2-space indentation, so any truthy indent means 2 spaces on
+        that path.
 
         Args:
             data: The data to be converted to JSON.
             indent (int, optional): Number of spaces for indentation. Defaults to None.
 
         Returns:
-            str: The JSON string representation of the data.
+            bytes: The UTF-8 encoded JSON representation of the data.
         """
-        return json.dumps(data, cls=CustomEncoder, ensure_ascii=False, indent=indent)
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(data, default=CustomEncoder().default, option=option)
+        return json.dumps(data, cls=CustomEncoder, ensure_ascii=False, indent=indent).encode('utf-8')
@@ -48,7 +48,7 @@ class DocumentationGenerator:
             os.makedirs(os.path.dirname(destination_readme_path), exist_ok=True)
 
             shutil.copyfile(self.read_me_path, destination_readme_path)
-            logger.info(f'Copied {self.read_me_path} to {destination_readme_path}')
+            logger.info('Copied %s to %s', self.read_me_path, destination_readme_path)
 
     def _generate_module_docs(self, file_path: str):
         try:
@@ -70,12 +70,12 @@ class DocumentationGenerator:
             if doc_content:
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write('\n'.join(doc_content))
-                logger.info(f'Documentation generated: {output_path}')
+                logger.info('Documentation generated: %s', output_path)
 
         except ImportError as e:
-            logger.error(f'Error importing module {file_path}: {e}')
+            logger.error('Error importing module %s: %s', file_path, e)
         except Exception as e:
-            logger.error(f'Error processing module {file_path}: {e}')
+            logger.error('Error processing module %s: %s', file_path, e)
 
     @staticmethod
     def _generate_class_documentation(relative_file_path: str, class_info: Dict) -> List[str]:
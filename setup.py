@@ -1,20 +1,33 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="multi_data_manager",
     version="0.1.1",
     description="A unified library for data management, database operations, and cloud interactions.",
     author="User",
-    packages=find_packages(),
+    # Explicit list: no filesystem walk on every build, and the packages
+    # ship regardless of __init__.py presence (find_packages skips
+    # namespace-style directories).
+    packages=[
+        "multi_data_manager",
+        "multi_data_manager.core",
+        "multi_data_manager.utils",
+        "multi_data_manager.database",
+        "multi_data_manager.handlers",
+    ],
     install_requires=[
-        "boto3",
-        "mysql-connector-python",
-        "pyodbc",
-        "pandas",
-        "requests",
-        "pyathena",
-        "sqlalchemy",
-        "pymysql"
+        "boto3>=1.26,<2",
+        "mysql-connector-python>=8.0,<10",
+        "opensearch-py>=2.4,<4",
+        "pandas>=2.0,<3",
+        "requests>=2.28,<3",
+        "sqlalchemy>=2.0,<3",
+        "pymysql>=1.0,<2",
+        "orjson>=3,<4"
     ],
+    extras_require={
+        "athena": ["pyathena>=3,<4"],
+        "mssql": ["pyodbc>=4.0,<6"],
+    },
     python_requires=">=3.9",
 )